@@ -1,6 +1,14 @@
 import unittest
 from unittest.mock import MagicMock
 
+from frictionless import Resource
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+from workflow_runner_py.exceptions import ParameterValueNotFoundException
 from workflow_runner_py.models.workflow_schema import (
     BasicFieldDataTypeSchema,
     FieldSchema,
@@ -14,12 +22,66 @@ from workflow_runner_py.validators import (
     ValidationFailure,
     _check_csv_columns,
     _validate_field,
+    parse_frictionless,
     validate_file_type,
     validate_row_count,
     validate_fieldset,
+    validate_fieldset_vectorized,
+    validate_fieldsets,
 )
 
 
+class TestValidationFailure(unittest.TestCase):
+    def test_model_dump(self):
+        failure = ValidationFailure(message="Bad value", row_number=3)
+        self.assertEqual(
+            failure.model_dump(), {"message": "Bad value", "row_number": 3}
+        )
+        self.assertEqual(
+            failure.model_dump(by_alias=True), {"message": "Bad value", "rowNumber": 3}
+        )
+
+    def test_model_dump_matches_pydantic_options(self):
+        failure = ValidationFailure(message="Bad file")
+        self.assertEqual(failure.model_dump(exclude_none=True), {"message": "Bad file"})
+        with self.assertRaises(TypeError):
+            failure.model_dump(exclude={"row_number"})
+        self.assertEqual(
+            ValidationFailure(message="Bad value", row_number=3).model_dump_json(
+                by_alias=True
+            ),
+            '{"message":"Bad value","rowNumber":3}',
+        )
+        self.assertEqual(
+            failure.model_dump_json(), '{"message":"Bad file","row_number":null}'
+        )
+        self.assertEqual(
+            ValidationFailure(message="Value 'café' is not allowed").model_dump_json(),
+            '{"message":"Value \'café\' is not allowed","row_number":null}',
+        )
+
+
+class TestParseFrictionless(unittest.TestCase):
+    file_contents = "name,age\nJohn,42\nJane,\n"
+
+    def test_on_string(self):
+        resource, failures = parse_frictionless(self.file_contents)
+        self.assertEqual(failures, [])
+        self.assertEqual(resource.data, self.file_contents.encode("utf-8"))
+
+    def test_on_bytes(self):
+        file_contents = self.file_contents.encode("utf-8")
+        resource, failures = parse_frictionless(file_contents)
+        self.assertEqual(failures, [])
+        self.assertIs(resource.data, file_contents)
+
+    def test_on_resource(self):
+        resource = Resource(self.file_contents.encode("utf-8"), format="csv")
+        parsed, failures = parse_frictionless(resource)
+        self.assertEqual(failures, [])
+        self.assertIs(parsed, resource)
+
+
 class TestValidateFile(unittest.TestCase):
     def test_validate_file_type(self):
         validation = FileTypeValidation(
@@ -52,11 +114,11 @@ class TestValidateRowCount(unittest.TestCase):
             title="Row count validation",
             description=None,
         )
-        self.assertEqual(validate_row_count([{}] * 2, validation), [])
-        self.assertEqual(validate_row_count([{}] * 3, validation), [])
-        self.assertEqual(validate_row_count([{}] * 4, validation), [])
+        self.assertEqual(validate_row_count(2, validation), [])
+        self.assertEqual(validate_row_count(3, validation), [])
+        self.assertEqual(validate_row_count(4, validation), [])
         self.assertEqual(
-            validate_row_count([{}], validation),
+            validate_row_count(1, validation),
             [
                 ValidationFailure(
                     message="File does not have the expected row count (min: 2, max: 4)",
@@ -65,7 +127,7 @@ class TestValidateRowCount(unittest.TestCase):
             ],
         )
         self.assertEqual(
-            validate_row_count([{}] * 5, validation),
+            validate_row_count(5, validation),
             [
                 ValidationFailure(
                     message="File does not have the expected row count (min: 2, max: 4)",
@@ -83,12 +145,12 @@ class TestValidateRowCount(unittest.TestCase):
             title="Row count validation",
             description=None,
         )
-        self.assertEqual(validate_row_count([], validation), [])
-        self.assertEqual(validate_row_count([{}], validation), [])
-        self.assertEqual(validate_row_count([{}] * 3, validation), [])
-        self.assertEqual(validate_row_count([{}] * 4, validation), [])
+        self.assertEqual(validate_row_count(0, validation), [])
+        self.assertEqual(validate_row_count(1, validation), [])
+        self.assertEqual(validate_row_count(3, validation), [])
+        self.assertEqual(validate_row_count(4, validation), [])
         self.assertEqual(
-            validate_row_count([{}] * 5, validation),
+            validate_row_count(5, validation),
             [
                 ValidationFailure(
                     message="File does not have the expected row count (min: None, max: 4)",
@@ -107,7 +169,7 @@ class TestValidateRowCount(unittest.TestCase):
             description=None,
         )
         self.assertEqual(
-            validate_row_count([{}], validation),
+            validate_row_count(1, validation),
             [
                 ValidationFailure(
                     message="File does not have the expected row count (min: 2, max: None)",
@@ -115,9 +177,29 @@ class TestValidateRowCount(unittest.TestCase):
                 )
             ],
         )
-        self.assertEqual(validate_row_count([{}] * 3, validation), [])
-        self.assertEqual(validate_row_count([{}] * 4, validation), [])
-        self.assertEqual(validate_row_count([{}] * 42, validation), [])
+        self.assertEqual(validate_row_count(3, validation), [])
+        self.assertEqual(validate_row_count(4, validation), [])
+        self.assertEqual(validate_row_count(42, validation), [])
+
+    def test_validate_row_count_with_zero_max_rows(self):
+        validation = RowCountValidation(
+            type="rowCountValidation",
+            id="123",
+            minRowCount=None,
+            maxRowCount=0,
+            title="Row count validation",
+            description=None,
+        )
+        self.assertEqual(validate_row_count(0, validation), [])
+        self.assertEqual(
+            validate_row_count(1, validation),
+            [
+                ValidationFailure(
+                    message="File does not have the expected row count (min: None, max: 0)",
+                    row_number=None,
+                )
+            ],
+        )
 
 
 def mock_field_schema(
@@ -324,6 +406,40 @@ class TestValidateField(unittest.TestCase):
             ],
         )
 
+    def test_validate_field_allowed_values_from_string_param(self):
+        field = mock_field_schema(
+            "name",
+            allowed_values=ParamReference(paramId="allowed_names"),
+        )
+        params = {"allowed_names": "John"}
+        self.assertEqual(_validate_field(1, {"name": "John"}, field, params), [])
+        self.assertEqual(
+            _validate_field(1, {"name": "J"}, field, params),
+            [
+                ValidationFailure(
+                    row_number=1, message="Value 'J' is not allowed for field 'name'"
+                )
+            ],
+        )
+
+    def test_validate_field_allowed_values_from_missing_param(self):
+        field = mock_field_schema(
+            "name",
+            allowed_values=ParamReference(paramId="allowed_names"),
+        )
+        fieldset_schema = FieldsetSchema(
+            id="123",
+            name="schema",
+            fields=[field],
+            orderMatters=False,
+            allowExtraColumns="anywhere",
+        )
+        for params in ({}, {"allowed_names": None}):
+            with self.assertRaisesRegex(ParameterValueNotFoundException, "allowed_names"):
+                _validate_field(1, {"name": "John"}, field, params)
+            with self.assertRaisesRegex(ParameterValueNotFoundException, "allowed_names"):
+                validate_fieldset(["name"], [], fieldset_schema, params)
+
     def test_validate_field_number_type(self):
         field = mock_field_schema(
             "age",
@@ -345,6 +461,32 @@ class TestValidateField(unittest.TestCase):
             ],
         )
 
+    def test_validate_field_empty_values_skip_type_checks(self):
+        field = mock_field_schema(
+            "age",
+            required=False,
+            allow_empty_values=True,
+            allowed_values=["1", "2"],
+            data_type_validation=BasicFieldDataTypeSchema(dataType="number"),
+        )
+        self.assertEqual(_validate_field(1, {"age": ""}, field, {}), [])
+        self.assertEqual(_validate_field(1, {"age": None}, field, {}), [])
+        self.assertEqual(_validate_field(1, {}, field, {}), [])
+
+        field = mock_field_schema(
+            "age",
+            allow_empty_values=False,
+            data_type_validation=BasicFieldDataTypeSchema(dataType="number"),
+        )
+        self.assertEqual(
+            _validate_field(1, {"age": ""}, field, {}),
+            [
+                ValidationFailure(
+                    row_number=1, message="Empty value for the field 'age'"
+                )
+            ],
+        )
+
     def test_validate_field_timestamp_type(self):
         field = mock_field_schema(
             "date",
@@ -435,3 +577,211 @@ class TestValidateFieldSet(unittest.TestCase):
                 )
             ],
         )
+
+    def test_validate_fieldset_with_typed_and_case_insensitive_fields(self):
+        fieldset_schema = FieldsetSchema(
+            id="123",
+            name="schema",
+            fields=[
+                mock_field_schema(
+                    "name",
+                    case_sensitive=False,
+                    allowed_values=ParamReference(paramId="allowed_names"),
+                ),
+                mock_field_schema(
+                    "age",
+                    data_type_validation=BasicFieldDataTypeSchema(dataType="number"),
+                ),
+            ],
+            orderMatters=False,
+            allowExtraColumns="anywhere",
+        )
+
+        self.assertEqual(
+            validate_fieldset(
+                ["Name", "age"],
+                [{"Name": "John", "age": "42"}, {"Name": "Bob", "age": "old"}],
+                fieldset_schema,
+                {"allowed_names": ["John", "Jane"]},
+            ),
+            [
+                ValidationFailure(
+                    message="File is missing columns required by the schema: {'name'}",
+                    row_number=None,
+                ),
+                ValidationFailure(
+                    message="Value 'Bob' is not allowed for field 'name'", row_number=2
+                ),
+                ValidationFailure(
+                    message="Value 'old' for field 'age' is not a valid number",
+                    row_number=2,
+                ),
+            ],
+        )
+
+    def test_validate_fieldset_matches_validate_field(self):
+        fields = [
+            mock_field_schema("name", case_sensitive=False, allowed_values=["John"]),
+            mock_field_schema(
+                "age",
+                allow_empty_values=True,
+                data_type_validation=BasicFieldDataTypeSchema(dataType="number"),
+            ),
+            mock_field_schema(
+                "date",
+                data_type_validation=TimestampDataTypeSchema(
+                    dataType="timestamp", dateTimeFormat="%Y-%m-%d"
+                ),
+            ),
+            mock_field_schema("notes", allow_empty_values=True),
+        ]
+        fieldset_schema = FieldsetSchema(
+            id="123",
+            name="schema",
+            fields=fields,
+            orderMatters=False,
+            allowExtraColumns="anywhere",
+        )
+        rows = [
+            {"NAME": "John", "age": "42", "date": "2021-01-01", "notes": ""},
+            {"NAME": "Jane", "age": "", "date": "", "notes": "late"},
+            {"NAME": None, "age": "4 2", "date": "2021-13-01", "notes": None},
+        ]
+
+        expected = [
+            failure
+            for row_num, row in enumerate(rows, start=1)
+            for field in fields
+            for failure in _validate_field(row_num, row, field, {})
+        ]
+        self.assertEqual(len(expected), 5)
+        self.assertEqual(
+            validate_fieldset(["NAME", "age", "date", "notes"], rows, fieldset_schema, {}),
+            _check_csv_columns(["NAME", "age", "date", "notes"], fieldset_schema)
+            + expected,
+        )
+
+    def test_validate_fieldsets_in_one_pass(self):
+        names_schema = FieldsetSchema(
+            id="123",
+            name="names",
+            fields=[mock_field_schema("name")],
+            orderMatters=False,
+            allowExtraColumns="anywhere",
+        )
+        ages_schema = FieldsetSchema(
+            id="456",
+            name="ages",
+            fields=[
+                mock_field_schema(
+                    "age",
+                    data_type_validation=BasicFieldDataTypeSchema(dataType="number"),
+                )
+            ],
+            orderMatters=False,
+            allowExtraColumns="anywhere",
+        )
+        rows = [
+            {"name": "John", "age": "42"},
+            {"name": "", "age": "old"},
+            {"name": "Jane", "age": ""},
+        ]
+
+        # the rows are a generator, so can only be read once
+        fieldset_validations, row_count = validate_fieldsets(
+            ["name", "age"], (row for row in rows), [names_schema, ages_schema], {}
+        )
+        self.assertEqual(row_count, 3)
+        self.assertEqual(
+            fieldset_validations,
+            [
+                validate_fieldset(["name", "age"], rows, names_schema, {}),
+                validate_fieldset(["name", "age"], rows, ages_schema, {}),
+            ],
+        )
+        self.assertEqual(
+            [len(validations) for validations in fieldset_validations], [1, 2]
+        )
+
+    def test_validate_fieldsets_without_fieldsets(self):
+        rows = [{"name": "John"}, {"name": ""}]
+        self.assertEqual(
+            validate_fieldsets(["name"], (row for row in rows), [], {}), ([], 2)
+        )
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class TestValidateFieldSetVectorized(unittest.TestCase):
+    def test_matches_validate_fieldset(self):
+        fieldset_schema = FieldsetSchema(
+            id="123",
+            name="schema",
+            fields=[
+                mock_field_schema("name", case_sensitive=False),
+                mock_field_schema(
+                    "age",
+                    allow_empty_values=True,
+                    data_type_validation=BasicFieldDataTypeSchema(dataType="number"),
+                ),
+                mock_field_schema(
+                    "date",
+                    data_type_validation=TimestampDataTypeSchema(
+                        dataType="timestamp", dateTimeFormat="%Y-%m-%d"
+                    ),
+                    allowed_values=ParamReference(paramId="allowed_dates"),
+                ),
+                mock_field_schema("missing", required=False),
+            ],
+            orderMatters=False,
+            allowExtraColumns="anywhere",
+        )
+        params = {"allowed_dates": ["2021-01-01", "2021-1-2", "2021-02-30"]}
+        rows = [
+            {"Name": "John", "age": "42", "date": "2021-01-01"},
+            {"Name": "", "age": "", "date": "2021-1-2"},
+            {"Name": "Jane", "age": "nan", "date": "2021-02-30"},
+            {"Name": "Bob", "age": "forty", "date": "2021-01-03"},
+        ]
+        columns = ["Name", "age", "date"]
+
+        expected = validate_fieldset(columns, rows, fieldset_schema, params)
+        self.assertEqual(
+            validate_fieldset_vectorized(
+                pd.DataFrame(rows, columns=columns), fieldset_schema, params
+            ),
+            expected,
+        )
+        self.assertEqual(
+            [failure.row_number for failure in expected],
+            [None, 1, 2, 2, 3, 3, 4, 4, 4],
+        )
+
+    def test_mixed_timezones(self):
+        fieldset_schema = FieldsetSchema(
+            id="123",
+            name="schema",
+            fields=[
+                mock_field_schema(
+                    "time",
+                    data_type_validation=TimestampDataTypeSchema(
+                        dataType="timestamp", dateTimeFormat="%Y-%m-%d %H:%M%z"
+                    ),
+                ),
+            ],
+            orderMatters=False,
+            allowExtraColumns="anywhere",
+        )
+        rows = [
+            {"time": "2021-01-01 12:00+0000"},
+            {"time": "2021-01-01 12:00+0500"},
+            {"time": "2021-01-01 12:00"},
+        ]
+
+        expected = validate_fieldset(["time"], rows, fieldset_schema, {})
+        self.assertEqual(
+            validate_fieldset_vectorized(
+                pd.DataFrame(rows, columns=["time"]), fieldset_schema, {}
+            ),
+            expected,
+        )
+        self.assertEqual([failure.row_number for failure in expected], [3])
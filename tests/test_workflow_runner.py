@@ -1,9 +1,23 @@
 import json
+import os
+import shutil
+import tempfile
 import unittest
 
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
 from pathlib import Path
 
-from workflow_runner_py.workflow_runner import process_workflow
+from workflow_runner_py.validators import parse_frictionless
+from workflow_runner_py.workflow_runner import (
+    _get_csv_contents_from_resource,
+    load_workflow_schema,
+    load_workflow_schema_cached,
+    process_workflow,
+)
 from workflow_runner_py.models.workflow_schema import WorkflowSchema
 
 DIR = Path(__file__).resolve().parent
@@ -15,7 +29,30 @@ BAD_DATA_PATH = DIR / "data/bad.csv"
 class TestWorkflowRunner(unittest.TestCase):
 
     def setUp(self):
-        self.schema = WorkflowSchema.model_validate(json.loads(SCHEMA_PATH.read_text()))
+        self.schema = load_workflow_schema_cached(SCHEMA_PATH)
+
+    def test_load_workflow_schema(self):
+        self.assertEqual(
+            load_workflow_schema(str(SCHEMA_PATH)),
+            WorkflowSchema.model_validate(json.loads(SCHEMA_PATH.read_text())),
+        )
+
+    def test_load_workflow_schema_cached(self):
+        with tempfile.TemporaryDirectory() as directory:
+            schema_path = os.path.join(directory, "workflow_schema.json")
+            shutil.copy(SCHEMA_PATH, schema_path)
+
+            schema = load_workflow_schema_cached(schema_path)
+            self.assertIs(load_workflow_schema_cached(schema_path), schema)
+
+            # changing the file invalidates the cached schema
+            schema_json = json.loads(SCHEMA_PATH.read_text())
+            schema_json["params"] = []
+            with open(schema_path, "w") as file:
+                json.dump(schema_json, file)
+            reloaded = load_workflow_schema_cached(schema_path)
+            self.assertIsNot(reloaded, schema)
+            self.assertEqual(reloaded.params, [])
 
     def test_on_good_data(self):
         failures = process_workflow(
@@ -37,3 +74,104 @@ class TestWorkflowRunner(unittest.TestCase):
         )
         
         self.assertEqual(len(failures), 2)
+
+    def test_without_frictionless_validation(self):
+        failures = process_workflow(
+            "tests/data/good.csv",
+            param_values={
+                "allowed_subjects": ["Math", "History", "Science"],
+            },
+            schema=self.schema,
+            implicit_frictionless_validation=False,
+        )
+        self.assertEqual(failures, [])
+
+        failures = process_workflow(
+            "tests/data/bad.csv",
+            param_values={
+                "allowed_subjects": ["Math", "History", "Science"],
+            },
+            schema=self.schema,
+            implicit_frictionless_validation=False,
+        )
+        self.assertEqual(len(failures), 2)
+
+    def test_get_csv_contents_from_resource_opens_lazily(self):
+        file_resource, _ = parse_frictionless(GOOD_DATA_PATH.read_bytes())
+        csv_data = _get_csv_contents_from_resource(file_resource)
+        self.assertEqual(csv_data.column_names, ["studentName", "subject", "grade"])
+        self.assertTrue(file_resource.closed)
+
+        rows = list(csv_data.data)
+        self.assertEqual(rows[0], {"studentName": "Alice", "subject": "Math", "grade": "A"})
+        self.assertTrue(file_resource.closed)
+
+    def test_without_frictionless_validation_with_byte_order_mark(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "good.csv")
+            Path(file_name).write_bytes(b"\xef\xbb\xbf" + GOOD_DATA_PATH.read_bytes())
+            failures = process_workflow(
+                file_name,
+                param_values={
+                    "allowed_subjects": ["Math", "History", "Science"],
+                },
+                schema=self.schema,
+                implicit_frictionless_validation=False,
+            )
+        self.assertEqual(failures, [])
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_vectorized(self):
+        failures = process_workflow(
+            "tests/data/good.csv",
+            param_values={
+                "allowed_subjects": ["Math", "History", "Science"],
+            },
+            schema=self.schema,
+            vectorized=True,
+        )
+        self.assertEqual(failures, [])
+
+        failures = process_workflow(
+            "tests/data/bad.csv",
+            param_values={
+                "allowed_subjects": ["Math", "History", "Science"],
+            },
+            schema=self.schema,
+            vectorized=True,
+        )
+        self.assertEqual(len(failures), 2)
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_vectorized_matches_without_frictionless_validation(self):
+        good = GOOD_DATA_PATH.read_bytes()
+        header, row = good.splitlines(keepends=True)[:2]
+        contents = {
+            "empty": b"",
+            "header_only": header,
+            "extra_cell": header + row + row.rstrip(b"\r\n") + b",extra\n",
+            "blank_lines": good + b"   \n\n",
+            "duplicated_header": header.rstrip(b"\r\n") + b",grade\n" + row.rstrip(b"\r\n") + b",\n",
+        }
+        param_values = {"allowed_subjects": ["Math", "History", "Science"]}
+
+        with tempfile.TemporaryDirectory() as directory:
+            for name, file_contents in contents.items():
+                with self.subTest(name):
+                    file_name = os.path.join(directory, f"{name}.csv")
+                    Path(file_name).write_bytes(file_contents)
+                    self.assertEqual(
+                        process_workflow(
+                            file_name,
+                            param_values=param_values,
+                            schema=self.schema,
+                            vectorized=True,
+                            implicit_frictionless_validation=False,
+                        ),
+                        process_workflow(
+                            file_name,
+                            param_values=param_values,
+                            schema=self.schema,
+                            implicit_frictionless_validation=False,
+                        ),
+                    )
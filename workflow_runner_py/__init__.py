@@ -1 +1 @@
-from .workflow_runner import process_workflow, load_workflow_schema
\ No newline at end of file
+from .workflow_runner import process_workflow, load_workflow_schema, load_workflow_schema_cached
\ No newline at end of file
@@ -4,4 +4,8 @@ class ParameterDefinitionNotFoundException(Exception):
 
 class FieldsetSchemaNotFoundException(Exception):
     """Exception raised when a fieldset schema is not found in the schema."""
-    pass
\ No newline at end of file
+    pass
+
+class ParameterValueNotFoundException(Exception):
+    """Exception raised when a parameter referenced by a field has no value."""
+    pass
@@ -1,15 +1,30 @@
 """The models to represent a WorkflowSchema"""
 
-from typing import Literal, Any
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Literal, Any
 
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-class CsvData(BaseModel):
+
+@dataclass(slots=True)
+class CsvData:
     """The Data in a CSV file"""
 
     column_names: list[str]
-    data: list[dict[str, Any]]
+    # the rows, which may be a stream that can only be iterated once
+    data: Iterable[dict[str, Any]]
+
+
+@dataclass(slots=True)
+class CsvFrame:
+    """The Data in a CSV file, loaded into a pandas DataFrame"""
+
+    column_names: list[str]
+    frame: "pd.DataFrame"
 
 
 class ParamReference(BaseModel):
@@ -124,7 +139,8 @@ def create_empty_workflow_schema() -> WorkflowSchema:
     """Create an empty Workflow Schema"""
     return WorkflowSchema(version="0.1", operations=[], fieldsetSchemas=[], params=[])
 
-class ValidationFailure(BaseModel):
+@dataclass(slots=True)
+class ValidationFailure:
     """
     A validation failure with a message.
 
@@ -134,4 +150,27 @@ class ValidationFailure(BaseModel):
         is no row number (e.g. if this is a file type error).
     """
     message: str
-    row_number: int | None = Field(default=None, serialization_alias="rowNumber")
\ No newline at end of file
+    row_number: int | None = None
+
+    def model_dump(
+        self, by_alias: bool = False, exclude_none: bool = False
+    ) -> dict[str, Any]:
+        """Serialize the failure to a dict, with the same keys as a pydantic `model_dump`."""
+        dumped: dict[str, Any] = {"message": self.message}
+        if self.row_number is not None or not exclude_none:
+            dumped["rowNumber" if by_alias else "row_number"] = self.row_number
+        return dumped
+
+    def model_dump_json(
+        self,
+        indent: int | None = None,
+        by_alias: bool = False,
+        exclude_none: bool = False,
+    ) -> str:
+        """Serialize the failure to JSON, with the same output as a pydantic `model_dump_json`."""
+        return json.dumps(
+            self.model_dump(by_alias=by_alias, exclude_none=exclude_none),
+            indent=indent,
+            separators=None if indent is not None else (",", ":"),
+            ensure_ascii=False,
+        )
@@ -1,4 +1,6 @@
-from typing import Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal
 import datetime
 
 from frictionless import validate, Resource
@@ -12,15 +14,29 @@ from .models.workflow_schema import (
     TimestampDataTypeSchema,
     ValidationFailure
 )
+from .exceptions import ParameterValueNotFoundException
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def parse_frictionless(file_contents) -> tuple[Resource, list[ValidationFailure]]:
+# bound once so the per-cell timestamp check skips the attribute lookups
+_strptime = datetime.datetime.strptime
+
+
+def parse_frictionless(
+    file_contents: str | bytes | bytearray | Resource,
+) -> tuple[Resource, list[ValidationFailure]]:
     """Validate the file using the Frictionless baseline checks and parse the file contents into a
-    Frictionless Resource if not already."""
+    Frictionless Resource if not already.
+    """
+    match file_contents:
+        case Resource():
+            resource = file_contents
+        case bytes() | bytearray():
+            resource = Resource(bytes(file_contents), format="csv")
+        case _:
+            resource = Resource(file_contents.encode("utf-8"), format="csv")
 
-    
-    resource = Resource(file_contents.encode("utf-8"), format="csv")
-    
     report = validate(resource, skip_errors=["missing-cell"])
     if not report.valid:
         return resource, [
@@ -44,12 +60,14 @@ def validate_file_type(
 
 
 def validate_row_count(
-    file_contents: list[dict], validation: RowCountValidation
+    row_count: int, validation: RowCountValidation
 ) -> list[ValidationFailure]:
     """Validate the row count of a file."""
-    min_row_count = validation.min_row_count or 0
-    max_row_count = validation.max_row_count or float("inf")
-    if not (min_row_count <= len(file_contents) <= max_row_count):
+    if (
+        validation.min_row_count is not None and row_count < validation.min_row_count
+    ) or (
+        validation.max_row_count is not None and row_count > validation.max_row_count
+    ):
         return [
             ValidationFailure(
                 message=f"File does not have the expected row count (min: {validation.min_row_count}, max: {validation.max_row_count})"
@@ -69,16 +87,20 @@ def _check_csv_columns(
 
     """
     validations = []
-    required_columns_in_schema = [
-        field.name for field in fieldset_schema.fields if field.required
-    ]
-    columnns_in_schema = [field.name for field in fieldset_schema.fields]
+    columnns_in_schema: list[str] = []
+    required_columns_in_schema: set[str] = set()
+    for field in fieldset_schema.fields:
+        columnns_in_schema.append(field.name)
+        if field.required:
+            required_columns_in_schema.add(field.name)
+    csv_column_set = set(csv_columns)
 
     # check that all required columns in the schema are present in the file
-    if not set(required_columns_in_schema) <= set(csv_columns):
+    missing_columns = required_columns_in_schema - csv_column_set
+    if missing_columns:
         validations.append(
             ValidationFailure(
-                message=f"File is missing columns required by the schema: {set(required_columns_in_schema) - set(csv_columns)}"
+                message=f"File is missing columns required by the schema: {missing_columns}"
             )
         )
 
@@ -92,7 +114,7 @@ def _check_csv_columns(
                 )
             )
 
-    if set(csv_columns) != set(columnns_in_schema):
+    if csv_column_set != set(columnns_in_schema):
         if fieldset_schema.allow_extra_columns == "no":
             validations.append(
                 ValidationFailure(
@@ -110,90 +132,384 @@ def _check_csv_columns(
     return validations
 
 
-def _validate_field(
-    row_num: int, row: dict, field: FieldSchema, params: dict[str, Any]
-) -> list[ValidationFailure]:
-    """Validate a field in a row."""
-    validations = []
+# the messages of the field checks, shared by the row-by-row and vectorized validation
+def _empty_value_message(field_name: str) -> str:
+    return f"Empty value for the field '{field_name}'"
 
-    # Get the value of the field from the row. If the field is case insensitive,
-    # we need to case-insensitively match the field name to the row keys.
-    if field.case_sensitive:
-        value = row.get(field.name)
-    else:
-        case_insensitive_values = {key.lower(): value for key, value in row.items()}
-        value = case_insensitive_values.get(field.name.lower())
 
-    # If the field does not allow empty values and the value is empty, add a validation failure.
-    if not field.allow_empty_values and (value == "" or value is None):
-        validations.append(
-            ValidationFailure(
-                row_number=row_num, message=f"Empty value for the field '{field.name}'"
-            )
-        )
+def _invalid_number_message(value: Any, field_name: str) -> str:
+    return f"Value '{value}' for field '{field_name}' is not a valid number"
+
+
+def _invalid_timestamp_message(
+    value: Any, field_name: str, date_time_format: str
+) -> str:
+    return f"Value '{value}' for field '{field_name}' does not match the expected timestamp format {date_time_format}"
+
+
+def _not_allowed_message(value: Any, field_name: str) -> str:
+    return f"Value '{value}' is not allowed for field '{field_name}'"
+
+
+def _param_value_set(param_value: Any) -> frozenset[Any]:
+    """Get the allowed values from a param value, which may be a single value."""
+    match param_value:
+        case str() | int() | float():
+            return frozenset((param_value,))
+        case _:
+            return frozenset(param_value)
+
+
+@dataclass(slots=True, frozen=True)
+class FieldPlan:
+    """
+    A FieldSchema resolved against the columns of a file and the params.
+
+    Arguments:
+    - name (str) -- The name of the field, as given in the schema
+    - row_key (str) -- The column to read the value from. For case insensitive
+        fields this is the CSV column whose name matches case-insensitively
+    - allow_empty_values (bool) -- Whether the field may have empty values
+    - data_type (str | None) -- The data type values are checked against, either
+        "number" or "timestamp", or None if there is nothing to check
+    - date_time_format (str | None) -- The format of "timestamp" values
+    - allowed_values (frozenset | None) -- The resolved allowed values, or None if
+        any value is allowed
+    """
 
-    # Validate the data type of each field
+    name: str
+    row_key: str
+    allow_empty_values: bool
+    data_type: Literal["number", "timestamp"] | None
+    date_time_format: str | None
+    allowed_values: frozenset[Any] | None
+
+    def check_data_type(self, value: Any) -> str | None:
+        """Return the failure message if a value does not match the data type."""
+        match self.data_type:
+            case "number":
+                try:
+                    float(value)
+                # TypeError is raised for values Frictionless parsed as a non-numeric
+                # type, e.g. dates
+                except (TypeError, ValueError):
+                    return _invalid_number_message(value, self.name)
+            case "timestamp":
+                try:
+                    _strptime(value, self.date_time_format)
+                except ValueError:
+                    return _invalid_timestamp_message(
+                        value, self.name, self.date_time_format
+                    )
+        return None
+
+
+def _compile_field(
+    field: FieldSchema,
+    params: dict[str, Any],
+    columns: dict[str, str],
+    lower_to_real: dict[str, str],
+    param_value_sets: dict[str, frozenset[Any]],
+) -> FieldPlan:
+    """Compile a field schema into a FieldPlan, resolving the column it reads from."""
+    data_type: Literal["number", "timestamp"] | None = None
+    date_time_format: str | None = None
     match field.data_type_validation:
-        case BasicFieldDataTypeSchema(data_type="string"):
-            pass  # no additional validation needed
         case BasicFieldDataTypeSchema(data_type="number"):
-            try:
-                float(value)
-            # TypeError is raised if value is None
-            except (TypeError, ValueError) as e:
-                # if value is None, and we haven't already added a validation failure for a missing value,
-                # create a validation failure
-                if (isinstance(e, TypeError) and not field.required) or isinstance(
-                    e, ValueError
-                ):
-                    validations.append(
-                        ValidationFailure(
-                            row_number=row_num,
-                            message=f"Value '{value}' for field '{field.name}' is not a valid number",
-                        )
-                    )
+            data_type = "number"
         case TimestampDataTypeSchema(
             data_type="timestamp", date_time_format=date_time_format
         ):
-            try:
-                datetime.datetime.strptime(value, date_time_format)
-            except ValueError:
-                validations.append(
-                    ValidationFailure(
-                        row_number=row_num,
-                        message=f"Value '{value}' for field '{field.name}' does not match the expected timestamp format {date_time_format}",
-                    )
-                )
+            data_type = "timestamp"
+        case _:
+            pass  # no additional validation needed
 
-    # If the field has a list of allowed values, check if the value is in the list.
+    allowed_values = None
     if field.allowed_values:
         if isinstance(field.allowed_values, list):
-            allowed_values = field.allowed_values
+            allowed_values = frozenset(field.allowed_values)
         else:
-            allowed_values = params[field.allowed_values.param_name]
-        if value not in allowed_values:
-            validations.append(
-                ValidationFailure(
-                    row_number=row_num,
-                    message=f"Value '{value}' is not allowed for field '{field.name}'",
+            param_name = field.allowed_values.param_name
+            allowed_values = param_value_sets.get(param_name)
+            if allowed_values is None:
+                param_value = params.get(param_name)
+                if param_value is None:
+                    raise ParameterValueNotFoundException(
+                        f"No value for parameter {param_name}, referenced by field {field.name}."
+                    )
+                allowed_values = param_value_sets[param_name] = _param_value_set(
+                    param_value
                 )
-            )
 
-    return validations
+    return FieldPlan(
+        name=field.name,
+        row_key=(
+            columns.get(field.name, field.name)
+            if field.case_sensitive
+            else lower_to_real.get(field.name.lower(), field.name)
+        ),
+        allow_empty_values=field.allow_empty_values,
+        data_type=data_type,
+        date_time_format=date_time_format,
+        allowed_values=allowed_values,
+    )
+
+
+def _compile_field_plan(
+    fieldset_schema: FieldsetSchema, params: dict[str, Any], csv_columns: Iterable[str]
+) -> list[FieldPlan]:
+    """Compile every field of a fieldset schema into a FieldPlan."""
+    # fields are resolved to the header's own string objects, which are also the
+    # row dict keys, so the per-cell lookups match by identity
+    columns = {column: column for column in csv_columns}
+    lower_to_real = {column.lower(): column for column in csv_columns}
+    param_value_sets: dict[str, frozenset[Any]] = {}
+    return [
+        _compile_field(field, params, columns, lower_to_real, param_value_sets)
+        for field in fieldset_schema.fields
+    ]
+
+
+def _validate_field(
+    row_num: int, row: dict, field: FieldSchema, params: dict[str, Any]
+) -> list[ValidationFailure]:
+    """Validate a field in a row."""
+    columns = {key: key for key in row}
+    lower_to_real = {key.lower(): key for key in row}
+    plan = _compile_field(field, params, columns, lower_to_real, {})
+    row_validations, _ = _check_rows([[plan]], [row], row_num)
+    return row_validations[0]
 
 
 def validate_fieldset(
     csv_columns,
-    csv_data: list[dict],
+    csv_data: Iterable[dict],
     fieldset_schema: FieldsetSchema,
     params: dict[str, Any],
 ) -> list[ValidationFailure]:
     """Validate the fieldset schema of a file."""
-    validations = []
+    fieldset_validations, _ = validate_fieldsets(
+        csv_columns, csv_data, [fieldset_schema], params
+    )
+    return fieldset_validations[0]
+
+
+def validate_fieldsets(
+    csv_columns,
+    csv_data: Iterable[dict],
+    fieldset_schemas: list[FieldsetSchema],
+    params: dict[str, Any],
+) -> tuple[list[list[ValidationFailure]], int]:
+    """Validate several fieldset schemas in one pass over the rows of a file.
+    Returns the failures for each fieldset schema and the number of rows."""
+    if not fieldset_schemas:
+        # there is nothing to check, so the rows only need to be counted
+        return [], sum(1 for _ in csv_data)
+
+    fieldset_plans = [
+        _compile_field_plan(fieldset_schema, params, csv_columns)
+        for fieldset_schema in fieldset_schemas
+    ]
+
+    row_validations, row_count = _check_rows(fieldset_plans, csv_data, 1)
+
+    fieldset_validations = [
+        _check_csv_columns(csv_columns, fieldset_schema) + validations
+        for fieldset_schema, validations in zip(fieldset_schemas, row_validations)
+    ]
+    return fieldset_validations, row_count
+
+
+def _check_rows(
+    fieldset_plans: list[list[FieldPlan]], rows: Iterable[dict], first_row_num: int
+) -> tuple[list[list[ValidationFailure]], int]:
+    """Validate rows against the field plans of each fieldset."""
+    row_validations: list[list[ValidationFailure]] = [[] for _ in fieldset_plans]
+    check_rows = _compile_rows_validator(fieldset_plans)
+    row_count = check_rows(rows, first_row_num, *row_validations)
+    return row_validations, row_count
+
+
+def _compile_rows_validator(
+    fieldset_plans: list[list[FieldPlan]],
+) -> Callable[..., int]:
+    """Generate a function that validates rows against the field plans of each fieldset.
+    It is called as `check_rows(rows, first_row_num, *validations)` and returns the number
+    of rows."""
+    constants: dict[str, Any] = {}
+
+    def constant(value: Any) -> str:
+        name = f"_c{len(constants)}"
+        constants[name] = value
+        return name
+
+    lines: list[str] = []
+    outs = [f"out_{index}" for index in range(len(fieldset_plans))]
+    for out, plans in zip(outs, fieldset_plans):
+        for plan in plans:
+            lines.extend(_field_check_source(plan, out, constant))
+
+    source = "\n".join(
+        [
+            f"def _make({', '.join(constants)}):",
+            f"    def check_rows(rows, first_row_num, {', '.join(outs)}):",
+            "        row_num = first_row_num - 1",
+            "        for row_num, row in enumerate(rows, first_row_num):",
+            "            get = row.get",
+            *(f"            {line}" for line in lines),
+            "        return row_num - first_row_num + 1",
+            "    return check_rows",
+        ]
+    )
+    return _exec_rows_validator_source(source)(**constants)
+
+
+@lru_cache(maxsize=128)
+def _exec_rows_validator_source(source: str) -> Callable[..., Callable[..., int]]:
+    """Compile the source of a rows validator, cached as it is shared between files."""
+    namespace = {
+        "_VF": ValidationFailure,
+        "_strptime": _strptime,
+        "_invalid_number_message": _invalid_number_message,
+        "_invalid_timestamp_message": _invalid_timestamp_message,
+        "_not_allowed_message": _not_allowed_message,
+    }
+    exec(compile(source, "<workflow_runner_py rows validator>", "exec"), namespace)
+    return namespace["_make"]
+
+
+def _field_check_source(
+    plan: FieldPlan, out: str, constant: Callable[[Any], str]
+) -> list[str]:
+    """Generate the lines that check a field of a row, appending failures to `out`."""
 
-    validations.extend(_check_csv_columns(csv_columns, fieldset_schema))
-    for row_num, row in enumerate(csv_data):
-        for field in fieldset_schema.fields:
-            validations.extend(_validate_field(row_num + 1, row, field, params))
+    def append(message: str) -> str:
+        return f"{out}.append(_VF({message}, row_num))"
 
+    name = constant(plan.name)
+    checks: list[str] = []
+    match plan.data_type:
+        case "number":
+            checks += [
+                "try:",
+                "    float(v)",
+                "except (TypeError, ValueError):",
+                "    " + append(f"_invalid_number_message(v, {name})"),
+            ]
+        case "timestamp":
+            date_time_format = constant(plan.date_time_format)
+            checks += [
+                "try:",
+                f"    _strptime(v, {date_time_format})",
+                "except ValueError:",
+                "    " + append(f"_invalid_timestamp_message(v, {name}, {date_time_format})"),
+            ]
+
+    if plan.allowed_values is not None:
+        checks += [
+            f"if v not in {constant(plan.allowed_values)}:",
+            "    " + append(f"_not_allowed_message(v, {name})"),
+        ]
+
+    if plan.allow_empty_values and not checks:
+        return []  # nothing to check
+
+    lines = [f"v = get({constant(plan.row_key)})"]
+    if plan.allow_empty_values:
+        lines.append('if v is not None and v != "":')
+    else:
+        empty_message = constant(_empty_value_message(plan.name))
+        lines += ['if v is None or v == "":', "    " + append(empty_message)]
+        if checks:
+            lines.append("else:")
+    lines.extend(f"    {check}" for check in checks)
+    return lines
+
+
+def import_pandas():
+    """Import pandas, which is only needed for vectorized validation."""
+    try:
+        import pandas
+    except ImportError as e:
+        raise ImportError(
+            "Vectorized validation requires pandas. Install it with the `vectorized` extra: "
+            '`pip install "workflow-runner-py[vectorized]"`.'
+        ) from e
+    return pandas
+
+
+def validate_fieldset_vectorized(
+    csv_frame: "pd.DataFrame",
+    fieldset_schema: FieldsetSchema,
+    params: dict[str, Any],
+) -> list[ValidationFailure]:
+    """Validate the fieldset schema of a file loaded into a pandas DataFrame, with the
+    same failures as `validate_fieldset`. pandas only finds the candidate failures, which
+    are then confirmed with the row-by-row checks."""
+    pd = import_pandas()
+
+    csv_columns = [str(column) for column in csv_frame.columns]
+    validations = _check_csv_columns(csv_columns, fieldset_schema)
+    plans = _compile_field_plan(fieldset_schema, params, csv_columns)
+
+    # (row index, field index, check index, failure), sorted at the end into the
+    # row-by-row order validate_fieldset produces
+    failures: list[tuple[int, int, int, ValidationFailure]] = []
+    # a duplicated column name reads the last of its columns, as in a row dict
+    column_positions = {column: position for position, column in enumerate(csv_columns)}
+    for field_index, plan in enumerate(plans):
+        if plan.row_key in column_positions:
+            column = csv_frame.iloc[:, column_positions[plan.row_key]].reset_index(drop=True)
+        else:
+            column = pd.Series([None] * len(csv_frame), dtype=object)
+        empty = column.isna() | (column == "")
+
+        if not plan.allow_empty_values:
+            message = _empty_value_message(plan.name)
+            failures.extend(
+                (row_index, field_index, 0, ValidationFailure(message, row_index + 1))
+                for row_index in column.index[empty].tolist()
+            )
+
+        present = column[~empty]
+        if plan.data_type is not None:
+            match plan.data_type:
+                case "timestamp":
+                    # utc=True lets values with different UTC offsets be parsed together
+                    try:
+                        candidates = pd.to_datetime(
+                            present, format=plan.date_time_format, errors="coerce", utc=True
+                        ).isna()
+                    except ValueError:
+                        # every value is checked with strptime below instead
+                        candidates = pd.Series(True, index=present.index)
+                case "number":
+                    candidates = pd.to_numeric(present, errors="coerce").isna()
+            for row_index, value in present[candidates].items():
+                row_index = int(row_index)
+                message = plan.check_data_type(value)
+                if message is not None:
+                    failures.append(
+                        (row_index, field_index, 1, ValidationFailure(message, row_index + 1))
+                    )
+
+        if plan.allowed_values is not None:
+            candidates = present[~present.isin(list(plan.allowed_values))]
+            for row_index, value in candidates.items():
+                row_index = int(row_index)
+                if value not in plan.allowed_values:
+                    failures.append(
+                        (
+                            row_index,
+                            field_index,
+                            2,
+                            ValidationFailure(
+                                _not_allowed_message(value, plan.name), row_index + 1
+                            ),
+                        )
+                    )
+
+    failures.sort(key=lambda failure: failure[:3])
+    validations.extend(failure[3] for failure in failures)
     return validations
+
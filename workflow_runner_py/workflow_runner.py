@@ -1,10 +1,14 @@
-import json
-from typing import Any
+import csv
+import functools
+import io
+import os
+from typing import Any, Iterator
 
 from frictionless import Resource
 
 from .models.workflow_schema import (
     CsvData,
+    CsvFrame,
     FieldsetSchema,
     FieldsetSchemaValidation,
     FileTypeValidation,
@@ -20,7 +24,9 @@ from .exceptions import (
     ParameterDefinitionNotFoundException,
 )
 from .validators import (
-    validate_fieldset,
+    import_pandas,
+    validate_fieldset_vectorized,
+    validate_fieldsets,
     validate_file_type,
     validate_row_count,
     parse_frictionless,
@@ -30,34 +36,64 @@ WorkflowParamValue = int | str | list[str] | None
 
 def load_workflow_schema(file_name: str) -> WorkflowSchema:
     """Load the schema of a workflow from a file."""
-    with open(file_name) as file:
-        file_contents = json.loads(file.read())
+    with open(file_name, "rb") as file:
+        file_contents = file.read()
+
+    return WorkflowSchema.model_validate_json(file_contents)
+
+
+def load_workflow_schema_cached(file_name: str | os.PathLike) -> WorkflowSchema:
+    """Load the schema of a workflow from a file, reusing it until the file's modification
+    time or size changes. The returned schema is shared, so it should not be modified."""
+    stat = os.stat(file_name)
+    return _load_workflow_schema_cached(
+        os.path.abspath(file_name), stat.st_mtime_ns, stat.st_size
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _load_workflow_schema_cached(
+    file_name: str, mtime_ns: int, size: int
+) -> WorkflowSchema:
+    """Load the schema of a workflow from a file, cached by its modification time and size."""
+    return load_workflow_schema(file_name)
 
-    return WorkflowSchema.model_validate(file_contents)
-    
 
 def process_workflow(
     file_name: str,
     param_values: dict[str, WorkflowParamValue],
     schema: WorkflowSchema,
+    implicit_frictionless_validation: bool = True,
+    vectorized: bool = False,
 ) -> list[ValidationFailure]:
-    """Validate and execute a workflow based on the configured schema and user-provided parameters."""
+    """
+    Validate and execute a workflow based on the configured schema and user-provided parameters.
 
-    with open(file_name) as file:
-        file_contents = file.read()
+    `implicit_frictionless_validation=False` skips the Frictionless baseline checks and reads
+    the values as plain strings. `vectorized=True` also reads plain strings, and validates
+    fieldsets with pandas from the optional `vectorized` extra.
+    """
 
-    schema = WorkflowSchema.model_validate(schema)
+    with open(file_name, "rb") as file:
+        file_contents = file.read()
 
     workflow_validation_failures: list[ValidationFailure] = []
 
-    file_resource, frictionless_baseline_validation_failures = parse_frictionless(
-        file_contents
-    )
-    workflow_validation_failures.extend(frictionless_baseline_validation_failures)
-
     _validate_param_values(param_values, schema)
 
-    csv_data = _get_csv_contents_from_resource(file_resource)
+    if implicit_frictionless_validation:
+        file_resource, frictionless_baseline_validation_failures = parse_frictionless(
+            file_contents
+        )
+        workflow_validation_failures.extend(frictionless_baseline_validation_failures)
+
+    csv_data: CsvData | CsvFrame
+    if vectorized:
+        csv_data = _get_csv_frame_from_bytes(file_contents)
+    elif implicit_frictionless_validation:
+        csv_data = _get_csv_contents_from_resource(file_resource)
+    else:
+        csv_data = _get_csv_contents_from_bytes(file_contents)
     workflow_validation_failures.extend(
         _validate_csv(file_name, csv_data, param_values, schema)
     )
@@ -72,31 +108,71 @@ def _validate_param_values(
     Validate the user-provided parameter values each correspond to
     a parameter definition in the workflow schema.
     """
+    param_names = {param.name for param in schema.params}
     for param_name in param_values:
-        if not any(param.name == param_name for param in schema.params):
+        if param_name not in param_names:
             raise ParameterDefinitionNotFoundException(
                 f"Parameter definition for {param_name} not found in schema."
             )
 
 
 def _get_csv_contents_from_resource(file_resource: Resource) -> CsvData:
-    """Get the CSV data from the contents of a file."""
-    all_rows: list[dict[str, Any]] = [row.to_dict() for row in file_resource.read_rows()]  # type: ignore
+    """Get the CSV data from the contents of a file. The resource is only opened while
+    the rows are iterated."""
+    if not file_resource.schema.fields:
+        # the schema is normally inferred by the baseline validation already
+        file_resource.infer()
     fieldnames = [field.name for field in file_resource.schema.fields]
 
+    def stream_rows() -> Iterator[dict[str, Any]]:
+        with file_resource:
+            for row in file_resource.row_stream:  # type: ignore
+                yield row.to_dict()
+
+    return CsvData(
+        column_names=fieldnames,
+        data=stream_rows(),
+    )
+
+
+def _get_csv_contents_from_bytes(file_contents: bytes) -> CsvData:
+    """Get the CSV data from the contents of a file without going through Frictionless."""
+    # utf-8-sig strips a byte order mark from the start of the file
+    reader = csv.DictReader(
+        io.TextIOWrapper(io.BytesIO(file_contents), encoding="utf-8-sig", newline="")
+    )
+    fieldnames = list(reader.fieldnames or [])
+
     return CsvData(
         column_names=fieldnames,
-        data=all_rows,
+        data=reader,
     )
 
 
+def _get_csv_frame_from_bytes(file_contents: bytes) -> CsvFrame:
+    """Get the CSV data from the contents of a file as a pandas DataFrame, read with the
+    same CSV reader as `_get_csv_contents_from_bytes` so both see the same rows."""
+    pd = import_pandas()
+    reader = csv.reader(
+        io.TextIOWrapper(io.BytesIO(file_contents), encoding="utf-8-sig", newline="")
+    )
+    column_names = next(reader, [])
+    # the rows are padded or cut to the header's width by the reindex
+    frame = pd.DataFrame([row for row in reader if row], dtype=object).reindex(
+        columns=range(len(column_names))
+    )
+    frame.columns = column_names
+
+    return CsvFrame(column_names=column_names, frame=frame)
+
+
 def _get_fieldset_schema(
-    fieldset_name: str, fieldsets: list[FieldsetSchema]
+    fieldset_name: str, fieldsets_by_name: dict[str, FieldsetSchema]
 ) -> FieldsetSchema:
-    """Get the fieldset schema from the list of fieldsets."""
-    for fieldset in fieldsets:
-        if fieldset.name == fieldset_name:
-            return fieldset
+    """Get the fieldset schema from the fieldsets, keyed by name."""
+    fieldset = fieldsets_by_name.get(fieldset_name)
+    if fieldset is not None:
+        return fieldset
     raise FieldsetSchemaNotFoundException(
         f"Fieldset schema {fieldset_name} not found in schema."
     )
@@ -104,18 +180,22 @@ def _get_fieldset_schema(
 
 def _validate_csv(
     file_name: str,
-    csv_data: CsvData,
+    csv_data: CsvData | CsvFrame,
     param_values: dict[str, WorkflowParamValue],
     schema: WorkflowSchema,
 ) -> list[ValidationFailure]:
     """Validate the CSV data based on the configured schema and user-provided parameters."""
-    validations = []
-
     param_schemas: dict[str, WorkflowParam] = {
         param.name: param for param in schema.params
     }
+    fieldsets_by_name: dict[str, FieldsetSchema] = {
+        fieldset.name: fieldset for fieldset in schema.fieldset_schemas
+    }
 
-    for operation in schema.operations:
+    # resolve the fieldset schema of every fieldset validation, keyed by the
+    # index of the operation, before reading any rows
+    fieldset_schemas: dict[int, FieldsetSchema] = {}
+    for index, operation in enumerate(schema.operations):
         match operation:
             case FieldsetSchemaValidation():
                 match operation.fieldset_schema:
@@ -140,20 +220,34 @@ def _validate_csv(
                                 )
                             ]
 
-                fieldset_schema = _get_fieldset_schema(
-                    fieldset_schema_name, schema.fieldset_schemas
-                )
-                validations.extend(
-                    validate_fieldset(
-                        csv_data.column_names,
-                        csv_data.data,
-                        fieldset_schema,
-                        param_values,
-                    )
+                fieldset_schemas[index] = _get_fieldset_schema(
+                    fieldset_schema_name, fieldsets_by_name
                 )
+
+    match csv_data:
+        case CsvFrame():
+            fieldset_validations = [
+                validate_fieldset_vectorized(csv_data.frame, fieldset_schema, param_values)
+                for fieldset_schema in fieldset_schemas.values()
+            ]
+            row_count = len(csv_data.frame)
+        case CsvData():
+            fieldset_validations, row_count = validate_fieldsets(
+                csv_data.column_names,
+                csv_data.data,
+                list(fieldset_schemas.values()),
+                param_values,
+            )
+    validations_by_operation = dict(zip(fieldset_schemas, fieldset_validations))
+
+    validations = []
+    for index, operation in enumerate(schema.operations):
+        match operation:
+            case FieldsetSchemaValidation():
+                validations.extend(validations_by_operation[index])
             case FileTypeValidation():
                 validations.extend(validate_file_type(file_name, operation))
             case RowCountValidation():
-                validations.extend(validate_row_count(csv_data.data, operation))
+                validations.extend(validate_row_count(row_count, operation))
 
     return validations